@@ -0,0 +1,34 @@
+"""Shared helpers for the example scripts."""
+
+import sys
+from collections.abc import AsyncIterator
+
+from gemini_cli_sdk import AssistantMessage, Message, TextBlock
+
+
+async def consume_text(
+    stream: AsyncIterator[Message], prefix: str | None = None
+) -> None:
+    """
+    Print the text blocks from a query() message stream.
+
+    Keeps the hot message/block loop in one place so all examples share
+    the same cheap exact-type dispatch. Output is buffered per message
+    and written with a single stdout write + flush, instead of one
+    lock/write/flush cycle per block via print().
+
+    Args:
+        stream: Async iterator of messages (typically from query())
+        prefix: Optional label printed before each text block
+    """
+    template = "{}\n" if prefix is None else f"{prefix}: {{}}\n"
+    buf: list[str] = []
+    async for message in stream:
+        if type(message) is AssistantMessage:
+            for block in message.content:
+                if type(block) is TextBlock:
+                    buf.append(template.format(block.text))
+            if buf:
+                sys.stdout.write("".join(buf))
+                sys.stdout.flush()
+                buf.clear()
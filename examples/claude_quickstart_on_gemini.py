@@ -7,11 +7,10 @@ Only the import is changed - everything else is identical.
 import anyio
 
 # ONLY CHANGE: Import from gemini_cli_sdk instead of claude_code_sdk
+from _common import consume_text
 from gemini_cli_sdk import (
     query,
     ClaudeCodeOptions,
-    AssistantMessage,
-    TextBlock,
 )
 
 
@@ -19,11 +18,7 @@ async def main():
     """Claude SDK example code - unchanged except for import."""
     
     # Basic example
-    async for message in query(prompt="What is 2 + 2?"):
-        if isinstance(message, AssistantMessage):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+    await consume_text(query(prompt="What is 2 + 2?"), prefix="Claude")
     
     # With options
     options = ClaudeCodeOptions(
@@ -31,14 +26,10 @@ async def main():
         max_turns=1,
     )
     
-    async for message in query(
-        prompt="Explain what Python is in one sentence.", 
-        options=options
-    ):
-        if isinstance(message, AssistantMessage):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(f"Claude: {block.text}")
+    await consume_text(
+        query(prompt="Explain what Python is in one sentence.", options=options),
+        prefix="Claude",
+    )
 
 
 if __name__ == "__main__":
@@ -9,12 +9,14 @@ import anyio
 try:
     from rich import print
     from rich.syntax import Syntax
+
+    _HAS_RICH = True
 except ImportError:
-    pass
+    _HAS_RICH = False
 
 
 async def main():
-    print("\n[bold]Migration from Claude SDK to Gemini SDK[/bold]\n" if "rich" in globals() else "\nMigration from Claude SDK to Gemini SDK\n")
+    print("\n[bold]Migration from Claude SDK to Gemini SDK[/bold]\n" if _HAS_RICH else "\nMigration from Claude SDK to Gemini SDK\n")
     
     # Option 1: Update imports
     code1 = """# Before (Claude SDK)
@@ -23,12 +25,12 @@ from claude_code_sdk import query, ClaudeCodeOptions
 # After (Gemini SDK)  
 from gemini_cli_sdk import query, GeminiOptions"""
     
-    if "rich" in globals():
+    if _HAS_RICH:
         print(Syntax(code1, "python", theme="monokai"))
     else:
         print(code1)
     
-    print("\n[bold]Option 2: Use compatibility aliases (zero code changes)[/bold]\n" if "rich" in globals() else "\nOption 2: Use compatibility aliases (zero code changes)\n")
+    print("\n[bold]Option 2: Use compatibility aliases (zero code changes)[/bold]\n" if _HAS_RICH else "\nOption 2: Use compatibility aliases (zero code changes)\n")
     
     # Option 2: Use aliases
     code2 = """# This Claude SDK code works unchanged with Gemini SDK
@@ -43,24 +45,24 @@ options = ClaudeCodeOptions(
 async for message in query(prompt="Hello", options=options):
     # ... process messages ..."""
     
-    if "rich" in globals():
+    if _HAS_RICH:
         print(Syntax(code2, "python", theme="monokai"))
     else:
         print(code2)
     
     # Live demo
-    print("\n[bold]Live Demo[/bold]\n" if "rich" in globals() else "\nLive Demo\n")
+    print("\n[bold]Live Demo[/bold]\n" if _HAS_RICH else "\nLive Demo\n")
     
-    from gemini_cli_sdk import query, ClaudeCodeOptions, AssistantMessage, TextBlock
+    from _common import consume_text
+    from gemini_cli_sdk import query, ClaudeCodeOptions
     
     # This is Claude SDK code but runs on Gemini
     options = ClaudeCodeOptions(max_turns=1)
     
-    async for message in query(prompt="Say 'Migration successful!'", options=options):
-        if isinstance(message, AssistantMessage):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(f"Result: {block.text}")
+    await consume_text(
+        query(prompt="Say 'Migration successful!'", options=options),
+        prefix="Result",
+    )
 
 
 if __name__ == "__main__":
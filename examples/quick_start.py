@@ -3,12 +3,11 @@
 
 import os
 import anyio
+from _common import consume_text
 from gemini_cli_sdk import (
     query,
     GeminiOptions,
     AssistantMessage,
-    TextBlock,
-    CodeBlock,
     # Compatibility aliases for Claude SDK migration
     ClaudeCodeOptions,
 )
@@ -16,58 +15,56 @@ from gemini_cli_sdk import (
 # Try to use rich for better output, fallback to regular print
 try:
     from rich import print
+
+    _HAS_RICH = True
 except ImportError:
-    pass
+    _HAS_RICH = False
+
+
+# Dispatch on the block's `type` tag instead of an isinstance cascade —
+# one dict lookup per block in the hot streaming loop
+BLOCK_HANDLERS = {
+    "text": lambda block: print(block.text),
+    "code": lambda block: print(f"\n```{block.language}\n{block.code}\n```"),
+}
 
 
 async def basic_example():
     """Basic usage - simple question."""
-    print("\n[bold]Basic Example[/bold]" if "rich" in globals() else "\nBasic Example")
+    print("\n[bold]Basic Example[/bold]" if _HAS_RICH else "\nBasic Example")
     
-    async for message in query(prompt="What is 2 + 2?"):
-        if isinstance(message, AssistantMessage):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(block.text)
+    await consume_text(query(prompt="What is 2 + 2?"))
 
 
 async def with_options():
     """Using custom options."""
-    print("\n[bold]With Options[/bold]" if "rich" in globals() else "\nWith Options")
+    print("\n[bold]With Options[/bold]" if _HAS_RICH else "\nWith Options")
     
     options = GeminiOptions(
         model="gemini-2.0-flash",
         system_prompt="You are a helpful assistant. Be concise.",
     )
     
-    async for message in query(
-        prompt="Explain Python's GIL in one sentence.", 
-        options=options
-    ):
-        if isinstance(message, AssistantMessage):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(block.text)
+    await consume_text(
+        query(prompt="Explain Python's GIL in one sentence.", options=options)
+    )
 
 
 async def code_generation():
     """Handle code generation responses."""
-    print("\n[bold]Code Generation[/bold]" if "rich" in globals() else "\nCode Generation")
+    print("\n[bold]Code Generation[/bold]" if _HAS_RICH else "\nCode Generation")
     
     async for message in query(prompt="Write a Python fibonacci function"):
-        if isinstance(message, AssistantMessage):
+        if type(message) is AssistantMessage:
             for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(block.text)
-                elif isinstance(block, CodeBlock):
-                    print(f"\n```{block.language}")
-                    print(block.code)
-                    print("```")
+                handler = BLOCK_HANDLERS.get(block.type)
+                if handler:
+                    handler(block)
 
 
 async def claude_compatibility():
     """Show compatibility with Claude SDK code."""
-    print("\n[bold]Claude SDK Compatibility[/bold]" if "rich" in globals() else "\nClaude SDK Compatibility")
+    print("\n[bold]Claude SDK Compatibility[/bold]" if _HAS_RICH else "\nClaude SDK Compatibility")
     
     # This code works unchanged from Claude SDK
     options = ClaudeCodeOptions(  # Claude's class name
@@ -75,16 +72,12 @@ async def claude_compatibility():
         max_turns=1,
     )
     
-    async for message in query(prompt="Hello", options=options):
-        if isinstance(message, AssistantMessage):
-            for block in message.content:
-                if isinstance(block, TextBlock):
-                    print(block.text)
+    await consume_text(query(prompt="Hello", options=options))
 
 
 async def error_handling():
     """Demonstrate error handling."""
-    print("\n[bold]Error Handling[/bold]" if "rich" in globals() else "\nError Handling")
+    print("\n[bold]Error Handling[/bold]" if _HAS_RICH else "\nError Handling")
     
     from gemini_cli_sdk import GeminiSDKError, ProcessError
     
@@ -101,11 +94,11 @@ async def error_handling():
 async def main():
     """Run examples."""
     if not (os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")):
-        print("[red]Error:[/red] GEMINI_API_KEY not set" if "rich" in globals() else "Error: GEMINI_API_KEY not set")
+        print("[red]Error:[/red] GEMINI_API_KEY not set" if _HAS_RICH else "Error: GEMINI_API_KEY not set")
         print("export GEMINI_API_KEY='your-key-here'")
         return
     
-    print("[bold]Gemini CLI SDK Examples[/bold]" if "rich" in globals() else "Gemini CLI SDK Examples")
+    print("[bold]Gemini CLI SDK Examples[/bold]" if _HAS_RICH else "Gemini CLI SDK Examples")
     
     await basic_example()
     await with_options()
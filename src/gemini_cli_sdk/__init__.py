@@ -35,6 +35,22 @@ from .types import (
 
 __version__ = "0.1.0"
 
+# Set SDK identifier once at import time rather than on every query() call
+os.environ.setdefault("GEMINI_CODE_SDK", "python")
+
+# Module-level client shared across query() calls so transport/parser state
+# (and any connection reuse they do) is not rebuilt per invocation
+_client: InternalClient | None = None
+
+
+def _get_client() -> InternalClient:
+    """Return the shared InternalClient, constructing it lazily."""
+    global _client
+    if _client is None:
+        _client = InternalClient()
+    return _client
+
+
 __all__ = [
     # Main function
     "query",
@@ -64,7 +80,7 @@ __all__ = [
 ]
 
 
-async def query(
+def query(
     *, prompt: str, options: GeminiOptions | None = None
 ) -> AsyncIterator[Message]:
     """
@@ -81,8 +97,8 @@ async def query(
                  Set options.sandbox=True to run in sandbox mode.
                  Set options.cwd for working directory.
 
-    Yields:
-        Messages from the conversation
+    Returns:
+        An async iterator of messages from the conversation
 
     Example:
         ```python
@@ -113,10 +129,6 @@ async def query(
     if options is None:
         options = GeminiOptions()
 
-    # Set SDK identifier
-    os.environ["GEMINI_CODE_SDK"] = "python"
-
-    client = InternalClient()
-
-    async for message in client.process_query(prompt=prompt, options=options):
-        yield message
+    # Return the underlying async generator directly instead of re-yielding
+    # each message through a wrapper generator frame
+    return _get_client().process_query(prompt=prompt, options=options)
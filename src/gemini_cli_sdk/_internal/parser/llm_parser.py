@@ -1,14 +1,23 @@
 """LLM-based parser for Gemini CLI output using Gemini's native structured output."""
 
+import asyncio
+import hashlib
+import itertools
 import logging
 import os
+import random
 import re
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from contextlib import aclosing
 from typing import Literal
 
+import numpy as np
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai.types import GenerateContentConfig
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 
 from ..._errors import ConfigurationError, ParsingError
 from ...types import (
@@ -21,16 +30,122 @@ from ...types import (
 )
 from . import ParserStrategy
 
+try:  # Optional: pip install gemini-cli-sdk[speed]
+    import ahocorasick  # type: ignore[import-not-found]
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+# Informational lines Gemini CLI mixes into stdout. Almost all of them
+# start the line, so they are checked with one C-level startswith(tuple)
+# call; the rest need a substring scan.
+_PREFIX_SKIPS = (
+    "Using GOOGLE_API_KEY",
+    "Using GEMINI_API_KEY",
+    "Today's date is",
+    "My operating system is:",
+    "I'm currently working in the directory:",
+    "Showing up to",
+    "This is the Gemini CLI",
+    "We are setting up the context",
+)
+_CONTAINS_SKIPS = (
+    "Both GOOGLE_API_KEY and GEMINI_API_KEY are set",
+)
+_SKIP_RE = re.compile("|".join(re.escape(s) for s in _CONTAINS_SKIPS))
+
+# Whole-text detector for any noise at all: one search decides whether
+# the per-line slow path is needed
+_ANY_NOISE_RE = re.compile(
+    "^(?:" + "|".join(re.escape(p) for p in _PREFIX_SKIPS) + ")"
+    "|" + "|".join(re.escape(s) for s in _CONTAINS_SKIPS),
+    re.MULTILINE,
+)
+
+
+def _build_skip_automaton() -> "ahocorasick.Automaton | None":
+    """Build an Aho-Corasick automaton over the substring skip patterns.
+
+    The automaton matches all patterns in one left-to-right pass, so the
+    per-line cost stays O(len(line)) as patterns are added.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in _CONTAINS_SKIPS:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKIP_AC = _build_skip_automaton()
+
+
+def _is_noise_line(line: str) -> bool:
+    """True if the line is Gemini CLI setup noise rather than content."""
+    if line.startswith(_PREFIX_SKIPS):
+        return True
+    if _SKIP_AC is not None:
+        return next(_SKIP_AC.iter(line), None) is not None
+    return _SKIP_RE.search(line) is not None
+
+# Purely numeric/arithmetic responses that never need LLM parsing
+_SIMPLE_NUMERIC_RE = re.compile(r'^[\d\s+\-*/=.,]+$')
+
+# Fenced code block: optional language tag, body up to the closing fence
+# (or end of text for unterminated fences)
+_FENCE_RE = re.compile(r'```([\w+-]*)\n(.*?)(?:```|\Z)', re.S)
+
+# Outputs containing these need the LLM's judgment to classify
+_ERROR_MARKERS = ("Error:", "Traceback (most recent call last)", "Exception:")
+
+# Compact parsing instruction, sent via system_instruction so the request
+# body carries only the output to parse
+_PARSE_INSTRUCTION = (
+    "Parse Gemini CLI output into structured JSON. Identify plain text, "
+    "code blocks (``` markers, note the language) and errors/warnings, "
+    "in order. Preserve the exact content."
+)
+
+# One genai.Client per API key for the lifetime of the process, so parser
+# instances share connection pools and TLS/auth state
+_CLIENT_CACHE: dict[str, genai.Client] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _is_transient(error: Exception) -> bool:
+    """True for Gemini errors worth retrying (429s and 5xx responses)."""
+    if isinstance(error, genai_errors.ServerError):
+        return True
+    return isinstance(error, genai_errors.ClientError) and error.code == 429
+
+
+def _get_genai_client(api_key: str) -> genai.Client:
+    """Return the shared genai.Client for this API key."""
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = _CLIENT_CACHE[api_key] = genai.Client(api_key=api_key)
+        return client
+
+
 # Structured schemas for LLM parsing
 class ParsedContent(BaseModel):
     """Individual content item parsed from output."""
 
     type: Literal["text", "code", "error"]
     content: str
-    language: str | None = Field(None, description="Language for code blocks")
+    language: str = Field(
+        default="plaintext", description="Language for code blocks"
+    )
+
+    @field_validator("language", mode="before")
+    @classmethod
+    def _default_language(cls, value: str | None) -> str:
+        # Normalize missing/empty language here so consumers never branch
+        return value or "plaintext"
 
 
 class ParsedResponse(BaseModel):
@@ -42,9 +157,116 @@ class ParsedResponse(BaseModel):
     summary: str = Field(description="Brief summary of the response", max_length=100)
 
 
+# Configs are immutable per schema, so build them once instead of paying
+# construction and schema introspection on every call
+_PARSE_CONFIG = GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=ParsedResponse,
+    system_instruction=_PARSE_INSTRUCTION,
+)
+_BATCH_PARSE_CONFIG = GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=list[ParsedResponse],
+    system_instruction=_PARSE_INSTRUCTION,
+)
+
+# Reused pydantic-core validator for the streaming JSON fallback; built
+# once so validate_json hits the compiled fast path directly
+_RESPONSE_ADAPTER = TypeAdapter(ParsedResponse)
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache for parsed CLI output.
+
+    Stores a normalized embedding of each cleaned output alongside the
+    parsed messages. Lookups match by cosine similarity against all
+    cached embeddings in one matrix-vector product. Entries are evicted
+    oldest-first once the cap is reached.
+    """
+
+    def __init__(
+        self,
+        client: genai.Client,
+        model: str = "text-embedding-004",
+        capacity: int = 256,
+        threshold: float = 0.92,
+    ):
+        self._client = client
+        self._model = model
+        self._capacity = capacity
+        self._threshold = threshold
+        self._exact: dict[bytes, list[Message]] = {}
+        self._keys: list[bytes] = []
+        self._messages: list[list[Message]] = []
+        self._matrix: np.ndarray | None = None  # stacked unit embeddings
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.sha256(text.encode()).digest()
+
+    async def embed(self, text: str) -> np.ndarray | None:
+        """Embed text into a unit vector, or None if embedding fails."""
+        try:
+            response = await self._client.aio.models.embed_content(
+                model=self._model, contents=text
+            )
+            # Both fields are Optional in the API types; an empty response
+            # just means no semantic caching for this entry
+            if not response.embeddings or response.embeddings[0].values is None:
+                return None
+            vector = np.asarray(response.embeddings[0].values, dtype=np.float32)
+            norm = float(np.linalg.norm(vector))
+            if not norm:
+                return None
+            return vector / norm
+        except Exception as e:
+            logger.debug(f"Embedding failed, skipping semantic cache: {e}")
+            return None
+
+    def lookup(self, embedding: np.ndarray) -> list[Message] | None:
+        """Return cached messages for the most similar entry above threshold.
+
+        The message objects are shared with the cache — callers must not
+        mutate them in place.
+        """
+        if self._matrix is None or not self._matrix.shape[0]:
+            return None
+        similarities = self._matrix @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self._threshold:
+            return [*self._messages[best]]
+        return None
+
+    def insert(
+        self, text: str, embedding: np.ndarray, messages: list[Message]
+    ) -> None:
+        """Cache the parsed messages under both exact key and embedding."""
+        key = self._key(text)
+        if key in self._exact:
+            return
+        while len(self._keys) >= self._capacity:
+            # Invariant: a non-empty key list implies a populated matrix
+            assert self._matrix is not None
+            evicted = self._keys.pop(0)
+            self._messages.pop(0)
+            del self._exact[evicted]
+            self._matrix = self._matrix[1:]
+        self._keys.append(key)
+        self._messages.append([*messages])
+        self._exact[key] = self._messages[-1]
+        row = embedding.reshape(1, -1)
+        self._matrix = (
+            row if self._matrix is None else np.vstack([self._matrix, row])
+        )
+
+
 class LLMParser(ParserStrategy):
     """Parser that uses Gemini to extract structured data from plain text."""
 
+    # Monotonic suffix for session IDs generated in the same second
+    _id_counter = itertools.count()
+
     def __init__(self, model: str = "gemini-2.5-flash-lite-preview-06-17"):
         """
         Initialize LLM parser using Gemini.
@@ -60,12 +282,19 @@ class LLMParser(ParserStrategy):
             )
 
         self.model = os.getenv("GEMINI_PARSER_MODEL", model)
-        self.client = genai.Client(api_key=api_key)
+        self.client = _get_genai_client(api_key)
+
+        # Bounded exact-match cache: blake2b(output, stderr) -> messages
+        self._exact_cache: OrderedDict[bytes, list[Message]] = OrderedDict()
+        self._exact_cache_cap = 512
+
+        # Semantic cache over embeddings of cleaned output
+        self._semantic_cache = SemanticCache(self.client)
 
-        # Cache for simple responses
-        self._simple_cache = {
-            "": [],  # Empty response
-        }
+        # Micro-batching state for concurrent parses
+        self._inflight = 0
+        self._pending: list[tuple[str, str, asyncio.Future[ParsedResponse]]] = []
+        self._drain_task: asyncio.Task[None] | None = None
 
     async def parse(self, raw_output: str, stderr: str = "") -> list[Message]:
         """
@@ -83,56 +312,64 @@ class LLMParser(ParserStrategy):
         # Strip common Gemini CLI prefixes/suffixes
         cleaned_output = self._clean_output(raw_output)
 
-        # Check cache for simple responses
-        if cleaned_output in self._simple_cache:
-            cached = self._simple_cache[cleaned_output]
-            if cached:
-                return cached.copy()
-
-        # Handle empty responses
-        if not cleaned_output or not cleaned_output.strip():
+        # Exact-match cache: repeated identical outputs cost one hash + lookup.
+        # blake2b is faster than sha256 on short inputs at the same safety
+        # margin for cache keying.
+        cache_key = hashlib.blake2b(
+            f"{cleaned_output}\x00{stderr}".encode(), digest_size=16
+        ).digest()
+        # Hits share message objects with the cache (callers treat parsed
+        # messages as read-only); only the outer list is fresh
+        cached = self._exact_cache.get(cache_key)
+        if cached is not None:
+            self._exact_cache.move_to_end(cache_key)
+            return [*cached]
+
+        # Handle empty responses (_clean_output returns stripped text)
+        if not cleaned_output:
             return messages
 
         # Quick check for simple numeric/single word responses
         if self._is_simple_response(cleaned_output):
             messages.append(
-                AssistantMessage(content=[TextBlock(text=cleaned_output.strip())])
+                AssistantMessage(content=[TextBlock(text=cleaned_output)])
             )
             return messages
 
+        # Deterministic fast path: plain text and fenced-code outputs
+        # don't need the LLM at all
+        if not stderr:
+            parsed = self._try_deterministic_parse(cleaned_output)
+            if parsed is not None:
+                messages = self._build_messages(parsed)
+                self._exact_cache[cache_key] = [*messages]
+                if len(self._exact_cache) > self._exact_cache_cap:
+                    self._exact_cache.popitem(last=False)
+                return messages
+
+        # Semantic cache: embedding similarity against prior parses. Only
+        # the cleaned output is embedded, so parses carrying stderr bypass
+        # the cache entirely — a hit keyed on stdout alone would return
+        # results parsed under a different stderr.
+        embedding = (
+            None if stderr else await self._semantic_cache.embed(cleaned_output)
+        )
+        if embedding is not None:
+            cached = self._semantic_cache.lookup(embedding)
+            if cached is not None:
+                return cached
+
         try:
             # Use Gemini to parse the output
             parsed = await self._parse_with_llm(cleaned_output, stderr)
+            messages = self._build_messages(parsed)
 
-            # Convert parsed response to SDK messages
-            content_blocks: list[ContentBlock] = []
-
-            for item in parsed.contents:
-                if item.type == "text":
-                    content_blocks.append(TextBlock(text=item.content))
-                elif item.type == "code":
-                    content_blocks.append(CodeBlock(
-                        code=item.content,
-                        language=item.language or "plaintext"
-                    ))
-                elif item.type == "error":
-                    # For errors, we'll add as text with error prefix
-                    content_blocks.append(TextBlock(
-                        text=f"Error: {item.content}"
-                    ))
-
-            if content_blocks:
-                messages.append(AssistantMessage(content=content_blocks))
-
-            # Add result message with basic metadata
-            messages.append(ResultMessage(
-                subtype="success" if not parsed.has_error else "error",
-                duration_ms=100,  # Placeholder
-                is_error=parsed.has_error,
-                session_id=self._generate_session_id(),
-                num_turns=1,
-                result=parsed.summary if not parsed.has_error else None
-            ))
+            # Cache the successful parse for identical and similar reruns
+            self._exact_cache[cache_key] = [*messages]
+            if len(self._exact_cache) > self._exact_cache_cap:
+                self._exact_cache.popitem(last=False)
+            if embedding is not None:
+                self._semantic_cache.insert(cleaned_output, embedding, messages)
 
         except Exception as e:
             logger.error(f"LLM parsing failed: {e}")
@@ -150,69 +387,290 @@ class LLMParser(ParserStrategy):
 
         return messages
 
-    async def _parse_with_llm(self, output: str, stderr: str) -> ParsedResponse:
-        """Use Gemini to parse the output into structured format."""
+    def _build_messages(self, parsed: ParsedResponse) -> list[Message]:
+        """Convert a ParsedResponse into SDK messages."""
+        messages: list[Message] = []
+        content_blocks: list[ContentBlock] = []
+
+        for item in parsed.contents:
+            if item.type == "text":
+                content_blocks.append(TextBlock(text=item.content))
+            elif item.type == "code":
+                content_blocks.append(CodeBlock(
+                    code=item.content,
+                    language=item.language
+                ))
+            elif item.type == "error":
+                # For errors, we'll add as text with error prefix
+                content_blocks.append(TextBlock(
+                    text=f"Error: {item.content}"
+                ))
+
+        if content_blocks:
+            messages.append(AssistantMessage(content=content_blocks))
+
+        # Add result message with basic metadata
+        messages.append(ResultMessage(
+            subtype="success" if not parsed.has_error else "error",
+            duration_ms=100,  # Placeholder
+            is_error=parsed.has_error,
+            session_id=self._generate_session_id(),
+            num_turns=1,
+            result=parsed.summary if not parsed.has_error else None
+        ))
 
-        system_prompt = """You are a parser for Gemini CLI output.
-        Extract structured information from the CLI output.
+        return messages
 
-        Identify:
-        1. Plain text responses
-        2. Code blocks (with language if specified) - look for ``` markers
-        3. Error messages or warnings
-        4. Multiple content sections if present
+    def _try_deterministic_parse(self, text: str) -> ParsedResponse | None:
+        """
+        Parse plain-text/fenced-code output without the LLM.
 
-        Be precise and preserve the exact content."""
+        Returns None when the output needs the LLM's judgment (error or
+        traceback markers, or backticks that don't parse as a fence),
+        leaving classification to _parse_with_llm.
+        """
+        if any(marker in text for marker in _ERROR_MARKERS):
+            return None
 
-        prompt = f"{system_prompt}\n\nParse this Gemini CLI output:\n\n{output}"
-        if stderr:
-            prompt += f"\n\nStderr output:\n{stderr}"
+        summary = text[:100]
 
-        try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config=GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=ParsedResponse,
+        if '```' not in text:
+            return ParsedResponse(
+                contents=[ParsedContent(type="text", content=text)],
+                has_code=False,
+                has_error=False,
+                summary=summary,
+            )
+
+        contents: list[ParsedContent] = []
+        position = 0
+        has_code = False
+        for match in _FENCE_RE.finditer(text):
+            gap = text[position:match.start()].strip()
+            if gap:
+                contents.append(ParsedContent(type="text", content=gap))
+            contents.append(ParsedContent(
+                type="code",
+                content=match.group(2).rstrip('\n'),
+                language=match.group(1),
+            ))
+            has_code = True
+            position = match.end()
+
+        # Backticks that never parsed as a fence (e.g. inline ```) are
+        # ambiguous — defer to the LLM instead of mislabeling the output
+        if not has_code:
+            return None
+
+        tail = text[position:].strip()
+        if tail:
+            contents.append(ParsedContent(type="text", content=tail))
+
+        return ParsedResponse(
+            contents=contents,
+            has_code=has_code,
+            has_error=False,
+            summary=summary,
+        )
+
+    # Micro-batching tunables: how many concurrent parses share one Gemini
+    # call, and how long a queued parse waits for others to join
+    _MAX_BATCH = 8
+    _BATCH_WINDOW = 0.02  # seconds
+
+    # Outputs at least this long are parsed via the streaming API so the
+    # JSON decode overlaps with the network transfer
+    _STREAM_THRESHOLD = 2048  # characters
+
+    # Attempts per Gemini call before surfacing the error (transient
+    # failures back off exponentially between attempts)
+    _MAX_RETRIES = 3
+
+    async def _parse_with_llm(self, output: str, stderr: str) -> ParsedResponse:
+        """
+        Use Gemini to parse the output into structured format.
+
+        When no other parse is in flight, the request goes out directly
+        with no added latency. Under concurrency, requests join a small
+        batch that is sent as a single Gemini call and fanned back out.
+        """
+        if self._inflight == 0:
+            self._inflight += 1
+            try:
+                results = await self._call_parse_llm([(output, stderr)])
+                return results[0]
+            finally:
+                self._inflight -= 1
+
+        # Another parse is already in flight: join the next batch
+        future: asyncio.Future[ParsedResponse] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending.append((output, stderr, future))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.ensure_future(self._drain_pending())
+        return await future
+
+    async def _drain_pending(self) -> None:
+        """Flush queued parse requests in batches after a short window."""
+        await asyncio.sleep(self._BATCH_WINDOW)
+        while self._pending:
+            batch = self._pending[: self._MAX_BATCH]
+            del self._pending[: self._MAX_BATCH]
+            self._inflight += 1
+            try:
+                results = await self._call_parse_llm(
+                    [(output, stderr) for output, stderr, _ in batch]
                 )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, _, future), parsed in zip(batch, results, strict=True):
+                    if not future.done():
+                        future.set_result(parsed)
+            finally:
+                self._inflight -= 1
+
+    async def _call_parse_llm(
+        self, items: list[tuple[str, str]]
+    ) -> list[ParsedResponse]:
+        """Parse one or more (output, stderr) pairs with a single Gemini call."""
+        if len(items) == 1:
+            output, stderr = items[0]
+            prompt = output
+            if stderr:
+                prompt += f"\n\nStderr output:\n{stderr}"
+            config = _PARSE_CONFIG
+        else:
+            sections = []
+            for index, (output, stderr) in enumerate(items, start=1):
+                section = f"--- Output {index} ---\n{output}"
+                if stderr:
+                    section += f"\n\nStderr output {index}:\n{stderr}"
+                sections.append(section)
+            prompt = (
+                f"Parse each of the following {len(items)} Gemini CLI outputs "
+                "and return a JSON array with one result per output, in order:"
+                "\n\n" + "\n\n".join(sections)
             )
-            
-            # response.parsed already returns the parsed Pydantic object
-            return response.parsed
-            
-        except Exception as e:
-            raise ParsingError(
-                "Gemini parsing failed",
-                raw_output=output,
-                original_error=e
-            ) from e
+            config = _BATCH_PARSE_CONFIG
+
+        raw_output = "\n\n".join(output for output, _ in items)
+
+        for attempt in range(self._MAX_RETRIES):
+            try:
+                # Large single outputs: stream the response so JSON decoding
+                # overlaps with generation instead of waiting for the full body
+                if len(items) == 1 and len(items[0][0]) >= self._STREAM_THRESHOLD:
+                    return [await self._stream_parse(prompt)]
+
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=config,
+                )
+
+                # response.parsed already returns the parsed Pydantic
+                # object(s), but is None when the SDK couldn't parse the
+                # response — validate rather than hand bad values downstream.
+                # Widened to object because the SDK's annotation omits the
+                # list case that list[...] response schemas produce.
+                parsed: object = response.parsed
+                if len(items) == 1:
+                    if not isinstance(parsed, ParsedResponse):
+                        raise ParsingError(
+                            "Expected a parsed result, "
+                            f"got {type(parsed).__name__}",
+                            raw_output=raw_output,
+                        )
+                    return [parsed]
+                if not isinstance(parsed, list) or len(parsed) != len(items):
+                    raise ParsingError(
+                        f"Expected {len(items)} parsed results, "
+                        f"got {len(parsed) if isinstance(parsed, list) else type(parsed)}",
+                        raw_output=raw_output,
+                    )
+                results = []
+                for entry in parsed:
+                    if not isinstance(entry, ParsedResponse):
+                        raise ParsingError(
+                            "Expected ParsedResponse entries, "
+                            f"got {type(entry).__name__}",
+                            raw_output=raw_output,
+                        )
+                    results.append(entry)
+                return results
+
+            except ParsingError:
+                raise
+            except Exception as e:
+                # Rate limits and server-side failures are usually
+                # transient: back off and retry before giving up
+                if _is_transient(e) and attempt + 1 < self._MAX_RETRIES:
+                    delay = min(2 ** attempt, 4) + random.random() * 0.1
+                    logger.warning(
+                        f"Transient Gemini error ({e}); "
+                        f"retrying in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                raise ParsingError(
+                    "Gemini parsing failed",
+                    raw_output=raw_output,
+                    original_error=e
+                ) from e
+
+        raise ParsingError("Gemini parsing failed", raw_output=raw_output)
+
+    async def _stream_parse(self, prompt: str) -> ParsedResponse:
+        """Parse via the streaming API, decoding JSON as chunks arrive."""
+        stream = await self.client.aio.models.generate_content_stream(
+            model=self.model,
+            contents=prompt,
+            config=_PARSE_CONFIG,
+        )
+
+        buffer: list[str] = []
+        # aclosing ensures the stream (and its HTTP response) is closed
+        # even when the eager decode returns before exhausting it. The
+        # SDK types the stream as a bare AsyncIterator, but the runtime
+        # object is an async generator with aclose().
+        async with aclosing(stream):  # type: ignore[type-var]
+            async for chunk in stream:
+                if not chunk.text:
+                    continue
+                buffer.append(chunk.text)
+                # The schema-closed JSON object can only terminate on '}',
+                # so attempt the decode eagerly and stop as soon as it
+                # succeeds. The adapter parses and validates in one pass
+                # through pydantic-core instead of json.loads -> dict ->
+                # model.
+                if chunk.text.rstrip().endswith("}"):
+                    try:
+                        return _RESPONSE_ADAPTER.validate_json("".join(buffer))
+                    except ValidationError:
+                        continue
+
+        # Stream ended without an eager decode succeeding
+        return _RESPONSE_ADAPTER.validate_json("".join(buffer))
 
     def _clean_output(self, output: str) -> str:
-        """Remove common Gemini CLI artifacts from output."""
-        # Remove the informational messages Gemini adds
-        lines_to_skip = [
-            "Both GOOGLE_API_KEY and GEMINI_API_KEY are set",
-            "Using GOOGLE_API_KEY",
-            "Using GEMINI_API_KEY",
-            "Today's date is",
-            "My operating system is:",
-            "I'm currently working in the directory:",
-            "Showing up to",
-            "This is the Gemini CLI",
-            "We are setting up the context"
-        ]
-
-        lines = output.strip().split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            # Skip lines that contain setup messages
-            if any(skip in line for skip in lines_to_skip):
-                continue
-            cleaned_lines.append(line)
-
-        return '\n'.join(cleaned_lines).strip()
+        """Remove common Gemini CLI artifacts from output.
+
+        Invariant: the returned string is already stripped, so callers
+        never need to strip it again.
+        """
+        # Fast path: most outputs contain no CLI noise at all — one regex
+        # search avoids the split/filter/join allocations entirely
+        if not _ANY_NOISE_RE.search(output):
+            return output.strip()
+
+        return '\n'.join(
+            line for line in output.splitlines()
+            if not _is_noise_line(line)
+        ).strip()
 
     def _is_simple_response(self, text: str) -> bool:
         """Check if response is simple enough to not need LLM parsing."""
@@ -220,10 +678,13 @@ class LLMParser(ParserStrategy):
         if '\n' not in text and '```' not in text and len(text) < 100:
             return True
 
-        # Just a number or simple calculation result
-        return bool(re.match(r'^[\d\s\+\-\*\/\=\.\,]+$', text.strip()))
+        # Just a number or simple calculation result (text arrives
+        # pre-stripped from _clean_output)
+        return _SIMPLE_NUMERIC_RE.match(text) is not None
 
     def _generate_session_id(self) -> str:
         """Generate a simple session ID."""
-        # Simple timestamp-based ID
-        return f"gemini-{int(datetime.now().timestamp())}"
\ No newline at end of file
+        # time_ns avoids the datetime construction; the counter keeps IDs
+        # unique across parses within the same second
+        seconds = time.time_ns() // 1_000_000_000
+        return f"gemini-{seconds}-{next(self._id_counter)}"
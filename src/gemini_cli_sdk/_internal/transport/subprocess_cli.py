@@ -7,7 +7,6 @@ from pathlib import Path
 from subprocess import PIPE
 
 import anyio
-from anyio.abc import Process
 
 from ..._errors import CLIConnectionError, CLINotFoundError, ProcessError
 from ...types import GeminiOptions
@@ -27,7 +26,10 @@ class SubprocessCLITransport(Transport):
             cli_path: Path to Gemini CLI executable (auto-detected if None)
         """
         self._cli_path = str(cli_path) if cli_path else self._find_cli()
-        self._process: Process | None = None
+        # Number of CLI processes currently running. The handles
+        # themselves stay local to execute() so concurrent queries
+        # don't share per-query state.
+        self._active_processes = 0
 
     def _find_cli(self) -> str:
         """Find Gemini CLI binary."""
@@ -117,7 +119,6 @@ class SubprocessCLITransport(Transport):
 
     async def disconnect(self) -> None:
         """No persistent connection to close."""
-        self._process = None
 
     async def execute(self, prompt: str, options: GeminiOptions) -> tuple[str, str]:
         """
@@ -145,7 +146,9 @@ class SubprocessCLITransport(Transport):
             # Run the command
             logger.debug(f"Running command: {' '.join(cmd)}")
 
-            self._process = await anyio.open_process(
+            # Keep the process handle local: the transport is shared across
+            # concurrent queries, so per-query state must not live on self
+            process = await anyio.open_process(
                 cmd,
                 stdin=None,  # No stdin for non-interactive mode
                 stdout=PIPE,
@@ -158,24 +161,28 @@ class SubprocessCLITransport(Transport):
             stdout_data = b""
             stderr_data = b""
 
-            # Read stdout
-            if self._process.stdout:
-                try:
-                    async for chunk in self._process.stdout:
-                        stdout_data += chunk
-                except anyio.EndOfStream:
-                    pass
-
-            # Read stderr
-            if self._process.stderr:
-                try:
-                    async for chunk in self._process.stderr:
-                        stderr_data += chunk
-                except anyio.EndOfStream:
-                    pass
-
-            # Wait for process to complete
-            returncode = await self._process.wait()
+            self._active_processes += 1
+            try:
+                # Read stdout
+                if process.stdout:
+                    try:
+                        async for chunk in process.stdout:
+                            stdout_data += chunk
+                    except anyio.EndOfStream:
+                        pass
+
+                # Read stderr
+                if process.stderr:
+                    try:
+                        async for chunk in process.stderr:
+                            stderr_data += chunk
+                    except anyio.EndOfStream:
+                        pass
+
+                # Wait for process to complete
+                returncode = await process.wait()
+            finally:
+                self._active_processes -= 1
 
             # Decode output
             stdout = stdout_data.decode("utf-8", errors="replace")
@@ -206,9 +213,7 @@ class SubprocessCLITransport(Transport):
             if isinstance(e, (ProcessError, CLIConnectionError, CLINotFoundError)):
                 raise
             raise CLIConnectionError(f"Failed to execute Gemini CLI: {e}") from e
-        finally:
-            self._process = None
 
     def is_connected(self) -> bool:
-        """Check if subprocess is running."""
-        return self._process is not None and self._process.returncode is None
+        """Check if any CLI subprocess is currently running."""
+        return self._active_processes > 0
@@ -9,7 +9,7 @@ PermissionMode = Literal["default", "acceptEdits", "bypassPermissions"]
 
 
 # Content block types
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """Text content block."""
 
@@ -17,7 +17,7 @@ class TextBlock:
     type: Literal["text"] = "text"
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlock:
     """Code content block with language."""
 
@@ -27,7 +27,7 @@ class CodeBlock:
 
 
 # Tool blocks - simplified for initial implementation
-@dataclass
+@dataclass(slots=True)
 class ToolUseBlock:
     """Tool use content block (placeholder for future)."""
 
@@ -37,7 +37,7 @@ class ToolUseBlock:
     type: Literal["tool_use"] = "tool_use"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResultBlock:
     """Tool result content block (placeholder for future)."""
 
@@ -52,7 +52,7 @@ ContentBlock = Union[TextBlock, CodeBlock, ToolUseBlock, ToolResultBlock]
 
 
 # Message types
-@dataclass
+@dataclass(slots=True)
 class UserMessage:
     """User message."""
 
@@ -60,7 +60,7 @@ class UserMessage:
     type: Literal["user"] = "user"
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantMessage:
     """Assistant message with content blocks."""
 
@@ -68,7 +68,7 @@ class AssistantMessage:
     type: Literal["assistant"] = "assistant"
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMessage:
     """System message with metadata."""
 
@@ -77,7 +77,7 @@ class SystemMessage:
     type: Literal["system"] = "system"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultMessage:
     """Result message with execution information."""
 
@@ -97,7 +97,7 @@ class ResultMessage:
 Message = Union[UserMessage, AssistantMessage, SystemMessage, ResultMessage]
 
 
-@dataclass
+@dataclass(slots=True)
 class GeminiOptions:
     """Query options for Gemini SDK (compatible with ClaudeCodeOptions)."""
 
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+import gemini_cli_sdk
 from gemini_cli_sdk import (
     AssistantMessage,
     CLINotFoundError,
@@ -14,6 +15,14 @@ from gemini_cli_sdk import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_client():
+    """Reset the cached module-level client so each test sees fresh mocks."""
+    gemini_cli_sdk._client = None
+    yield
+    gemini_cli_sdk._client = None
+
+
 @pytest.mark.asyncio
 async def test_query_basic():
     """Test basic query functionality with mocked transport."""
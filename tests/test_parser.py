@@ -0,0 +1,242 @@
+"""Tests for LLM parser helpers (no network calls)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from gemini_cli_sdk._internal.parser.llm_parser import (
+    LLMParser,
+    ParsedContent,
+    ParsedResponse,
+)
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    """LLMParser with a dummy API key (client is never called)."""
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    return LLMParser()
+
+
+def test_clean_output_strips_cli_noise(parser):
+    """Setup/informational lines are removed, content is kept."""
+    raw = (
+        "Using GEMINI_API_KEY from environment\n"
+        "Today's date is Monday\n"
+        "The answer is 4\n"
+        "This is the Gemini CLI session\n"
+    )
+    assert parser._clean_output(raw) == "The answer is 4"
+
+
+def test_clean_output_passthrough(parser):
+    """Output without CLI noise is returned stripped but otherwise intact."""
+    raw = "  line one\nline two  \n"
+    assert parser._clean_output(raw) == "line one\nline two"
+
+
+def test_deterministic_parse_splits_fenced_code(parser):
+    """Fenced-code output is parsed without an LLM call."""
+    text = "Here is the function:\n```python\ndef f():\n    return 1\n```\nDone."
+    parsed = parser._try_deterministic_parse(text)
+
+    assert parsed is not None
+    assert parsed.has_code is True
+    assert [c.type for c in parsed.contents] == ["text", "code", "text"]
+    assert parsed.contents[1].language == "python"
+    assert parsed.contents[1].content == "def f():\n    return 1"
+
+
+def test_deterministic_parse_defers_unparseable_fences_to_llm(parser):
+    """Backticks that never parse as a fence fall through to the LLM."""
+    assert parser._try_deterministic_parse("Use ``` to fence code.") is None
+
+
+def test_deterministic_parse_defers_errors_to_llm(parser):
+    """Outputs with error markers are left for the LLM to classify."""
+    assert parser._try_deterministic_parse("Error: something broke") is None
+    assert (
+        parser._try_deterministic_parse(
+            "Traceback (most recent call last):\n  ..."
+        )
+        is None
+    )
+
+
+def _parsed_response(text):
+    return ParsedResponse(
+        contents=[ParsedContent(type="text", content=text)],
+        has_code=False,
+        has_error=False,
+        summary="test",
+    )
+
+
+@pytest.mark.asyncio
+async def test_parse_with_llm_batches_concurrent_requests(parser):
+    """Concurrent parses coalesce into fewer Gemini calls."""
+    calls = []
+
+    async def fake_generate_content(*, model, contents, config):
+        calls.append(contents)
+        await asyncio.sleep(0.01)
+        if config.response_schema is ParsedResponse:
+            parsed = _parsed_response("direct")
+        else:
+            count = contents.count("--- Output")
+            parsed = [_parsed_response(f"batched {i}") for i in range(count)]
+        return SimpleNamespace(parsed=parsed)
+
+    parser.client = SimpleNamespace(
+        aio=SimpleNamespace(
+            models=SimpleNamespace(generate_content=fake_generate_content)
+        )
+    )
+
+    results = await asyncio.gather(
+        *[parser._parse_with_llm(f"output {i}\nsecond line", "") for i in range(4)]
+    )
+
+    assert len(results) == 4
+    assert all(isinstance(r, ParsedResponse) for r in results)
+    # One direct call plus one coalesced batch for the three that queued
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_bypassed_for_stderr_parses(parser, monkeypatch):
+    """Parses carrying stderr must not hit the stdout-keyed semantic cache."""
+    unit = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+
+    async def fake_embed(text):
+        return unit
+
+    monkeypatch.setattr(parser._semantic_cache, "embed", fake_embed)
+
+    async def fake_generate_content(*, model, contents, config):
+        stderr = contents.split("Stderr output:\n")[-1]
+        return SimpleNamespace(
+            parsed=ParsedResponse(
+                contents=[ParsedContent(type="error", content=stderr)],
+                has_code=False,
+                has_error=True,
+                summary="error",
+            )
+        )
+
+    parser.client = SimpleNamespace(
+        aio=SimpleNamespace(
+            models=SimpleNamespace(generate_content=fake_generate_content)
+        )
+    )
+
+    first = await parser.parse("same stdout both runs\nsecond line", "stderr run ONE")
+    second = await parser.parse("same stdout both runs\nsecond line", "stderr run TWO")
+
+    assert "stderr run ONE" in first[0].content[0].text
+    assert "stderr run TWO" in second[0].content[0].text
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(parser, monkeypatch):
+    """429/5xx responses are retried with backoff before giving up."""
+    from google.genai import errors as genai_errors
+
+    from gemini_cli_sdk._internal.parser import llm_parser
+
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(llm_parser.asyncio, "sleep", fake_sleep)
+
+    attempts = 0
+
+    async def flaky_generate_content(*, model, contents, config):
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise genai_errors.ServerError(
+                503, {"error": {"message": "unavailable"}}
+            )
+        return SimpleNamespace(parsed=_parsed_response("recovered"))
+
+    parser.client = SimpleNamespace(
+        aio=SimpleNamespace(
+            models=SimpleNamespace(generate_content=flaky_generate_content)
+        )
+    )
+
+    results = await parser._call_parse_llm([("some\noutput", "")])
+
+    assert results[0].contents[0].content == "recovered"
+    assert attempts == 3
+    assert len(sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_non_transient_errors_fail_immediately(parser):
+    """Other client errors surface as ParsingError without retries."""
+    from google.genai import errors as genai_errors
+
+    from gemini_cli_sdk import ParsingError
+
+    attempts = 0
+
+    async def bad_request(*, model, contents, config):
+        nonlocal attempts
+        attempts += 1
+        raise genai_errors.ClientError(400, {"error": {"message": "bad request"}})
+
+    parser.client = SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=bad_request))
+    )
+
+    with pytest.raises(ParsingError):
+        await parser._call_parse_llm([("some\noutput", "")])
+    assert attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_unparsed_response_raises_parsing_error(parser):
+    """A response the SDK couldn't parse surfaces as ParsingError, not None."""
+    from gemini_cli_sdk import ParsingError
+
+    async def unparsed(*, model, contents, config):
+        return SimpleNamespace(parsed=None)
+
+    parser.client = SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=unparsed))
+    )
+
+    with pytest.raises(ParsingError):
+        await parser._call_parse_llm([("some\noutput", "")])
+
+
+@pytest.mark.asyncio
+async def test_large_outputs_use_streaming_parse(parser):
+    """Outputs past the threshold are parsed via generate_content_stream."""
+    payload = _parsed_response("streamed").model_dump_json()
+    half = len(payload) // 2
+
+    async def fake_stream(*, model, contents, config):
+        async def chunks():
+            yield SimpleNamespace(text=payload[:half])
+            yield SimpleNamespace(text=payload[half:])
+
+        return chunks()
+
+    parser.client = SimpleNamespace(
+        aio=SimpleNamespace(
+            models=SimpleNamespace(generate_content_stream=fake_stream)
+        )
+    )
+
+    big_output = "line\n" * (parser._STREAM_THRESHOLD // 5 + 1)
+    results = await parser._call_parse_llm([(big_output, "")])
+
+    assert len(results) == 1
+    assert results[0].contents[0].content == "streamed"